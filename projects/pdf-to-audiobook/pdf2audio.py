@@ -1,73 +1,441 @@
 """Small desktop app to convert a PDF to audio.
 
 This provides a minimal Tkinter GUI where you can pick a PDF, choose
-offline (pyttsx3 -> WAV) or online (gTTS -> MP3) output, and convert.
+offline (pyttsx3 -> WAV) or online (gTTS or edge-tts -> MP3) output, and
+convert.
 
 Notes:
 - pyttsx3 reliably writes WAV files offline.
-- gTTS writes MP3 but requires internet and (for long PDFs) pydub+ffmpeg
-  to merge chunks. The app will attempt to use pydub if installed.
+- gTTS writes MP3 but requires internet and (for long PDFs) ffmpeg to
+  merge chunks. pydub is used as a fallback merger if ffmpeg is not on PATH.
+- edge-tts also requires internet but streams a single MP3, so no merge
+  step is needed.
 """
 
+import collections
+import hashlib
+import importlib
+import importlib.util
+import io
+import itertools
+import mmap
+import multiprocessing
 import os
+import re
+import shutil
+import subprocess
 import sys
 import threading
+import time
+import wave
 import tempfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
 import tkinter as tk
-from tkinter import filedialog, messagebox
+from tkinter import filedialog, messagebox, ttk
 
-try:
-    import PyPDF2
-except Exception:
-    # Show a friendly GUI error explaining how to install dependencies
+# Heavy optional dependencies are imported on first use rather than at
+# startup, so the window appears without waiting on PDF/TTS libraries.
+_modules = {}
+
+
+def _lazy(name):
+    """Import and return module ``name``, or None if it is not installed."""
+    if name not in _modules:
+        try:
+            _modules[name] = importlib.import_module(name)
+        except Exception:
+            _modules[name] = None
+    return _modules[name]
+
+
+def _installed(name):
+    # find_spec locates a module without importing it
     try:
-        root = tk.Tk()
-        root.withdraw()
-        messagebox.showerror(
-            "Missing dependency",
-            "PyPDF2 is not installed.\n\nPlease run the following in PowerShell in this project folder:\n\npython -m venv .venv; .\\.venv\\Scripts\\Activate.ps1; python -m pip install --upgrade pip; pip install -r requirements.txt\n\nThen re-run this program.")
+        return importlib.util.find_spec(name) is not None
     except Exception:
-        # fallback to printing
-        print("ERROR: PyPDF2 is not installed. Run: pip install -r requirements.txt")
-    sys.exit(1)
+        return False
+
+
+# PDF backends, fastest first. PyMuPDF and pypdfium2 wrap native engines and
+# are much faster than PyPDF2, which is kept only as a last-resort fallback.
+# PyMuPDF is imported as "pymupdf"; "fitz" is its deprecated legacy alias.
+PDF_BACKENDS = ("pymupdf", "fitz", "pypdfium2", "PyPDF2")
+_PYMUPDF_NAMES = ("pymupdf", "fitz")
+
+
+def _pdf_backend():
+    for name in PDF_BACKENDS:
+        mod = _lazy(name)
+        if mod is not None:
+            return name, mod
+    raise RuntimeError("No PDF library is installed (PyMuPDF, pypdfium2 or PyPDF2)")
+
+
+# PDFs with fewer pages than this are extracted serially; below it the cost
+# of starting worker processes outweighs the parallel speedup.
+PARALLEL_MIN_PAGES = 16
+# Pages submitted to the pool ahead of the one currently being consumed.
+PAGE_WINDOW = 2 * (os.cpu_count() or 1)
+
+
+def _get_object_from_stream_cached(self, indirect_reference):
+    """Replacement for PyPDF2's PdfReader._get_object_from_stream.
+
+    The stock version decodes the object stream and re-reads its header of
+    (objnum, offset) pairs on every lookup, which is quadratic for large
+    /ObjStm streams. This parses each stream's header once per reader and
+    seeks straight to the requested object.
+    """
+    from PyPDF2._utils import logger_warning, read_non_whitespace
+    from PyPDF2.errors import PdfReadError, PdfStreamError
+    from PyPDF2.generic import IndirectObject, NullObject, NumberObject, read_object
+
+    stmnum, idx = self.xref_objStm[indirect_reference.idnum]
+    cache = self.__dict__.setdefault("_objstm_offset_cache", {})
+    entry = cache.get(stmnum)
+    if entry is None:
+        obj_stm = IndirectObject(stmnum, 0, self).get_object()
+        # This is an xref to a stream, so its type better be a stream
+        assert obj_stm["/Type"] == "/ObjStm"
+        stream_data = io.BytesIO(obj_stm.get_data())
+        offsets = {}
+        for i in range(obj_stm["/N"]):
+            read_non_whitespace(stream_data)
+            stream_data.seek(-1, 1)
+            objnum = NumberObject.read_from_stream(stream_data)
+            read_non_whitespace(stream_data)
+            stream_data.seek(-1, 1)
+            offset = NumberObject.read_from_stream(stream_data)
+            # stock PyPDF2 stops at the first match, so keep the first entry
+            # if a malformed header repeats an object number
+            offsets.setdefault(int(objnum), (i, int(obj_stm["/First"] + offset)))
+        entry = cache[stmnum] = (stream_data, offsets)
+    stream_data, offsets = entry
+
+    if indirect_reference.idnum not in offsets:
+        if self.strict:
+            raise PdfReadError("This is a fatal error in strict mode.")
+        return NullObject()
+    i, pos = offsets[indirect_reference.idnum]
+    if self.strict and idx != i:
+        raise PdfReadError("Object is in wrong index.")
+    stream_data.seek(pos, 0)
+    # to cope with some case where the 'pointer' is on a white space
+    read_non_whitespace(stream_data)
+    stream_data.seek(-1, 1)
+    try:
+        return read_object(stream_data, self)
+    except PdfStreamError as exc:
+        logger_warning(
+            f"Invalid stream (index {i}) within object "
+            f"{indirect_reference.idnum} {indirect_reference.generation}: {exc}",
+            # report under PyPDF2's logger like the method this replaces
+            "PyPDF2._reader",
+        )
+        if self.strict:
+            raise PdfReadError(f"Can't read object stream: {exc}")
+        return NullObject()
+
+
+def _patch_pypdf2_objstm(mod):
+    reader_cls = mod.PdfReader
+    if getattr(reader_cls, "_get_object_from_stream", None) is not _get_object_from_stream_cached:
+        reader_cls._get_object_from_stream = _get_object_from_stream_cached
+
+
+def _open_document(path):
+    """Open a PDF with the fastest available backend."""
+    name, mod = _pdf_backend()
+    if name in _PYMUPDF_NAMES:
+        return mod.open(path)
+    if name == "pypdfium2":
+        return mod.PdfDocument(path)
+    # PyPDF2 seeks around the file in many small reads; give it a memory map
+    # so those are served from the page cache instead of buffered syscalls.
+    # The map stays alive as long as the reader holds it.
+    with open(path, "rb") as f:
+        try:
+            stream = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            # empty files and some special filesystems cannot be mapped
+            stream = io.BytesIO(f.read())
+    _patch_pypdf2_objstm(mod)
+    return mod.PdfReader(stream)
+
+
+def _close_document(doc):
+    close = getattr(doc, "close", None)
+    if close is not None:
+        close()
+
 
-try:
-    import pyttsx3
-except Exception:
-    pyttsx3 = None
+def _page_count(doc):
+    if _pdf_backend()[0] == "PyPDF2":
+        return len(doc.pages)
+    return len(doc)
 
-try:
-    from gtts import gTTS
-except Exception:
-    gTTS = None
 
-try:
-    from pydub import AudioSegment
-except Exception:
-    AudioSegment = None
+# Text can only be drawn inside a BT/ET text object or by a form XObject
+# (Do). Pages whose content stream has neither, such as plots and figures,
+# are skipped without running the much slower text extraction.
+_TEXT_OPS_RE = re.compile(rb"\b(?:BT|Tj|TJ|Do)\b")
+
+
+def _has_text_ops(raw):
+    return raw is None or _TEXT_OPS_RE.search(raw) is not None
+
+
+def _page_text(doc, i):
+    """Return the text of page ``i`` (0-based) of an open document."""
+    name = _pdf_backend()[0]
+    if name in _PYMUPDF_NAMES:
+        page = doc[i]
+        if not _has_text_ops(page.read_contents()):
+            return ""
+        return page.get_text("text")
+    if name == "pypdfium2":
+        # pypdfium2 does not expose the raw content stream, so no prefilter
+        page = doc[i]
+        textpage = page.get_textpage()
+        try:
+            return textpage.get_text_range()
+        finally:
+            textpage.close()
+            page.close()
+    page = doc.pages[i]
+    contents = page.get_contents()
+    if contents is None:
+        return ""
+    if isinstance(contents, list):
+        # /Contents may be an array of streams
+        raw = b"".join(c.get_object().get_data() for c in contents)
+    else:
+        raw = contents.get_data()
+    if not _has_text_ops(raw):
+        return ""
+    return page.extract_text()
+
+
+# Each worker process keeps its own open document so it is only parsed once
+# per process rather than once per page.
+_worker_doc = None
+
+
+def _extract_page(path, i):
+    global _worker_doc
+    if _worker_doc is None or _worker_doc[0] != path:
+        if _worker_doc is not None:
+            _close_document(_worker_doc[1])
+        _worker_doc = (path, _open_document(path))
+    return _page_text(_worker_doc[1], i)
+
+
+def _iter_page_texts(path):
+    """Yield the text of each page in order.
+
+    Large documents are split across a process pool since page extraction
+    is CPU-bound and pages are independent.
+    """
+    doc = _open_document(path)
+    try:
+        n_pages = _page_count(doc)
+        if n_pages < PARALLEL_MIN_PAGES:
+            for i in range(n_pages):
+                yield _page_text(doc, i)
+            return
+    finally:
+        _close_document(doc)
+
+    # Keep only a small window of pages in flight rather than Executor.map,
+    # which submits every page up front and buffers all of their text no
+    # matter how slowly the TTS side consumes it.
+    ex = ProcessPoolExecutor()
+    try:
+        pages = iter(range(n_pages))
+        window = collections.deque(
+            ex.submit(_extract_page, path, i) for i in itertools.islice(pages, PAGE_WINDOW))
+        while window:
+            text = window.popleft().result()
+            for i in itertools.islice(pages, 1):
+                window.append(ex.submit(_extract_page, path, i))
+            yield text
+    except BaseException:
+        # the consumer stopped early (or a page failed); don't wait for the
+        # rest of the document to be extracted
+        ex.shutdown(wait=False, cancel_futures=True)
+        raise
+    ex.shutdown()
+
+
+def _iter_nonempty_pages(path):
+    for i, t in enumerate(_iter_page_texts(path), start=1):
+        if t:
+            yield t
+        else:
+            # skip pages with no extractable text
+            print(f"warning: page {i} has no extractable text, skipping")
 
 
 def extract_text_from_pdf(path):
-    parts = []
-    with open(path, "rb") as f:
-        reader = PyPDF2.PdfReader(f)
-        for i, page in enumerate(reader.pages, start=1):
-            t = page.extract_text()
-            if t:
-                parts.append(t)
-            else:
-                # skip pages with no extractable text
-                print(f"warning: page {i} has no extractable text, skipping")
-    return "\n\n".join(parts)
+    return "\n\n".join(_iter_nonempty_pages(path))
 
 
-def save_with_pyttsx3(text, out_path, rate=None, volume=None, voice_id=None, on_progress=None):
-    if pyttsx3 is None:
-        raise RuntimeError("pyttsx3 is not installed")
-    # Ensure wav extension
-    if not out_path.lower().endswith(".wav"):
-        out_path = os.path.splitext(out_path)[0] + ".wav"
-    engine = pyttsx3.init()
+# Sentence splitting runs over the whole book, so the pattern is compiled
+# once. Set PDF2AUDIO_USE_RE2=1 to use Google's re2 (linear-time DFA matching)
+# when it is installed; the pattern avoids lookbehind so both engines accept it.
+_sent_re_module = re
+if os.environ.get("PDF2AUDIO_USE_RE2") == "1":
+    try:
+        import re2 as _sent_re_module
+    except Exception:
+        pass
+_SENT_END_RE = _sent_re_module.compile(r'[.!?]\s+')
+
+
+def _split_sentences(text):
+    """Yield the sentences of text, keeping their end punctuation."""
+    start = 0
+    for m in _SENT_END_RE.finditer(text):
+        yield text[start:m.start() + 1]
+        start = m.end()
+    yield text[start:]
+
+
+def _chunk_text(pieces, max_chars=4500):
+    """Group an iterable of text pieces into chunks of at most max_chars.
+
+    Chunks are split on sentence boundaries where possible; a sentence
+    longer than max_chars is cut into max_chars slices.
+    """
+    buf = []
+    size = 0
+    for piece in pieces:
+        for sentence in _split_sentences(piece):
+            sentence = sentence.strip()
+            if not sentence:
+                continue
+            if buf and size + len(sentence) > max_chars:
+                yield " ".join(buf)
+                buf = []
+                size = 0
+            while len(sentence) > max_chars:
+                yield sentence[:max_chars]
+                sentence = sentence[max_chars:]
+            buf.append(sentence)
+            size += len(sentence) + 1
+    if buf:
+        yield " ".join(buf)
+
+
+def iter_text_chunks(path, max_chars=4500):
+    """Yield TTS-sized text chunks from a PDF as its pages are extracted.
+
+    Unlike extract_text_from_pdf this never holds the whole document text,
+    so synthesis can start as soon as the first page is parsed.
+    """
+    return _chunk_text(_iter_nonempty_pages(path), max_chars)
+
+
+# Synthesized chunks are cached on disk, keyed by their text and the voice
+# settings, so repeated boilerplate and re-runs of the same PDF skip TTS.
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "pdf2audio")
+CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+
+def _cache_key(chunk, *params):
+    h = hashlib.blake2b(digest_size=16)
+    for p in params:
+        h.update(repr(p).encode("utf-8") + b"\0")
+    h.update(chunk.encode("utf-8"))
+    return h.hexdigest()
+
+
+def _cache_fetch(key, ext, dest):
+    """Copy a cached chunk to dest; return False on a cache miss."""
+    src = os.path.join(CACHE_DIR, key + ext)
+    try:
+        shutil.copyfile(src, dest)
+        # refresh the timestamp so pruning drops least recently used first
+        os.utime(src)
+        return True
+    except OSError:
+        return False
+
+
+def _cache_store(key, ext, src):
+    tmp = None
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        # copy under a temporary name and rename into place, so an
+        # interrupted copy never leaves a truncated entry that looks valid
+        fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        os.close(fd)
+        shutil.copyfile(src, tmp)
+        os.replace(tmp, os.path.join(CACHE_DIR, key + ext))
+    except OSError:
+        # caching is best-effort
+        if tmp is not None:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
+
+def _cache_prune(max_bytes=CACHE_MAX_BYTES):
+    """Delete least recently used cache entries until under max_bytes."""
+    entries = []
+    try:
+        with os.scandir(CACHE_DIR) as it:
+            for e in it:
+                # skip copies another conversion is still writing
+                if e.name.endswith(".tmp"):
+                    continue
+                try:
+                    if not e.is_file():
+                        continue
+                    st = e.stat()
+                except OSError:
+                    # removed or replaced since the directory was listed
+                    continue
+                entries.append((st.st_mtime, st.st_size, e.path))
+    except OSError:
+        return
+    entries.sort(reverse=True)
+    total = 0
+    for _mtime, size, path in entries:
+        total += size
+        if total > max_bytes:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+# pyttsx3.init() starts the platform speech driver (SAPI5, NSSpeechSynthesizer,
+# espeak), which is slow, so one engine is shared for the life of the app.
+# The lock serializes access since conversions run on a worker thread.
+_engine = None
+_voices = None
+_engine_lock = threading.Lock()
+
+
+def _get_engine():
+    global _engine
+    if _engine is None:
+        _engine = _lazy("pyttsx3").init()
+    return _engine
+
+
+def get_voices():
+    """Return the installed pyttsx3 voices, read once and cached."""
+    global _voices
+    with _engine_lock:
+        if _voices is None:
+            _voices = tuple(_get_engine().getProperty('voices') or ())
+        return _voices
+
+
+def _apply_engine_settings(engine, rate=None, volume=None, voice_id=None):
     # Apply voice/rate/volume if provided to improve smoothness/speed
     try:
         if rate is not None:
@@ -81,61 +449,360 @@ def save_with_pyttsx3(text, out_path, rate=None, volume=None, voice_id=None, on_
         # ignore if the backend doesn't accept the property
         pass
 
-    # Save full text to a single WAV file (backend handles streaming)
-    engine.save_to_file(text, out_path)
-    engine.runAndWait()
+
+# Long texts are split into chunks of about this many characters and
+# synthesized in parallel worker processes, each with its own engine.
+PYTTSX3_CHUNK_CHARS = 2000
+# Chunks queued for the worker pool at once.
+PYTTSX3_MAX_PENDING = 2 * (os.cpu_count() or 1)
+
+_worker_engine = None
+
+
+def _init_pyttsx3_worker(rate, volume, voice_id):
+    global _worker_engine
+    _worker_engine = _lazy("pyttsx3").init()
+    _apply_engine_settings(_worker_engine, rate, volume, voice_id)
+
+
+def _synth_chunk_wav(chunk, path):
+    _worker_engine.save_to_file(chunk, path)
+    _worker_engine.runAndWait()
+    return path
+
+
+def _save_pyttsx3_chunks(chunks, out_path, rate, volume, voice_id, on_progress):
+    tmp_dir = tempfile.mkdtemp(prefix="pdf2audio-")
+    try:
+        paths = []
+        seen = {}  # cache key -> file already holding that chunk
+        pending = {}  # future -> cache key of the chunk it is synthesizing
+        done = 0
+
+        def finish(futures):
+            nonlocal done
+            for fut in futures:
+                _cache_store(pending.pop(fut), ".wav", fut.result())
+                done += 1
+                if on_progress:
+                    on_progress(f"Synthesized chunk {done}")
+
+        def prepare(idx, chunk):
+            """Record the chunk's file; return a job if it must be synthesized."""
+            key = _cache_key(chunk, "pyttsx3", voice_id, rate, volume)
+            if key in seen:
+                # same text earlier in this document; reuse its file
+                paths.append(seen[key])
+                return None
+            path = os.path.join(tmp_dir, f"{idx:05d}.wav")
+            paths.append(path)
+            seen[key] = path
+            if _cache_fetch(key, ".wav", path):
+                return None
+            return chunk, path, key
+
+        jobs = (job for job in itertools.starmap(prepare, enumerate(chunks)) if job is not None)
+        # every worker starts its own speech driver, so don't start more of
+        # them than there are chunks to synthesize
+        head = list(itertools.islice(jobs, os.cpu_count() or 1))
+        if head:
+            with ProcessPoolExecutor(max_workers=len(head), initializer=_init_pyttsx3_worker,
+                                     initargs=(rate, volume, voice_id)) as ex:
+                for chunk, path, key in itertools.chain(head, jobs):
+                    if len(pending) >= PYTTSX3_MAX_PENDING:
+                        # pull chunks from the parser only as fast as the pool
+                        # synthesizes them
+                        finish(wait(pending, return_when=FIRST_COMPLETED).done)
+                    pending[ex.submit(_synth_chunk_wav, chunk, path)] = key
+                finish(as_completed(list(pending)))
+        if done:
+            _cache_prune()
+        # every chunk comes from the same voice settings, so the WAVs share a
+        # format and can be joined without re-encoding
+        try:
+            concat_wav(paths, out_path)
+        except (wave.Error, EOFError):
+            # some drivers (nsss on macOS) write AIFF despite the .wav name.
+            # Its big-endian PCM can't be stream-copied into a WAV file, so
+            # have ffmpeg decode the chunks and write little-endian PCM.
+            if not shutil.which("ffmpeg"):
+                raise RuntimeError("ffmpeg is required to merge audio chunks from this speech driver")
+            concat_with_ffmpeg(paths, out_path, codec_args=("-c:a", "pcm_s16le"))
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def _can_merge_pyttsx3_chunks():
+    # The macOS driver (nsss) writes AIFF, which only ffmpeg can merge into a
+    # WAV; without it the whole text goes to a single engine call instead.
+    return sys.platform != "darwin" or shutil.which("ffmpeg") is not None
+
+
+def save_with_pyttsx3(text, out_path, rate=None, volume=None, voice_id=None, on_progress=None):
+    """Synthesize text with pyttsx3 and save it as a single WAV.
+
+    text may be a string or an iterable of chunks (see iter_text_chunks);
+    multi-chunk input is synthesized in parallel as chunks arrive.
+    """
+    if _lazy("pyttsx3") is None:
+        raise RuntimeError("pyttsx3 is not installed")
+    # Ensure wav extension
+    if not out_path.lower().endswith(".wav"):
+        out_path = os.path.splitext(out_path)[0] + ".wav"
+
+    if isinstance(text, str):
+        chunks = _chunk_text([text], PYTTSX3_CHUNK_CHARS)
+    else:
+        chunks = iter(text)
+    head = list(itertools.islice(chunks, 2))
+    if len(head) > 1 and _can_merge_pyttsx3_chunks():
+        _save_pyttsx3_chunks(itertools.chain(head, chunks), out_path, rate, volume, voice_id, on_progress)
+    else:
+        if not isinstance(text, str):
+            text = " ".join(itertools.chain(head, chunks))
+        with _engine_lock:
+            engine = _get_engine()
+            _apply_engine_settings(engine, rate, volume, voice_id)
+            # Save full text to a single WAV file (backend handles streaming)
+            engine.save_to_file(text, out_path)
+            engine.runAndWait()
     if on_progress:
         on_progress("Saved: %s" % out_path)
     return out_path
 
 
+OPUS_BITRATE = "24k"
+
+
+def encode_opus(in_path, out_path, bitrate=OPUS_BITRATE):
+    """Re-encode an audio file to Opus, which suits speech at low bitrates."""
+    proc = subprocess.run(
+        ["ffmpeg", "-y", "-loglevel", "error", "-i", in_path,
+         "-c:a", "libopus", "-b:a", bitrate, out_path],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"ffmpeg failed to encode Opus: {proc.stderr.strip()}")
+    return out_path
+
+
+def concat_wav(files, out_path):
+    """Join PCM WAV files with identical formats by copying their frames.
+
+    Only the data chunks are copied, under a single new header, so the merge
+    is one pass over the bytes and needs neither pydub nor ffmpeg.
+    """
+    params = None
+    with wave.open(out_path, "wb") as writer:
+        for name in files:
+            with wave.open(name, "rb") as reader:
+                fmt = (reader.getnchannels(), reader.getsampwidth(), reader.getframerate())
+                if params is None:
+                    params = fmt
+                    writer.setnchannels(fmt[0])
+                    writer.setsampwidth(fmt[1])
+                    writer.setframerate(fmt[2])
+                elif fmt != params:
+                    raise wave.Error(f"{name} does not match the format of the first chunk")
+                while True:
+                    frames = reader.readframes(1 << 16)
+                    if not frames:
+                        break
+                    writer.writeframes(frames)
+    return out_path
+
+
+def concat_with_ffmpeg(files, out_path, codec_args=("-c", "copy")):
+    """Join audio files with ffmpeg's concat demuxer.
+
+    By default packets are copied straight through with ``-c copy`` instead
+    of being decoded to PCM and encoded again, which only works when the
+    inputs already use a codec the output container supports. Pass other
+    codec_args (e.g. ``("-c:a", "pcm_s16le")``) to transcode instead.
+    """
+    fd, list_path = tempfile.mkstemp(suffix=".txt")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            for name in files:
+                escaped = os.path.abspath(name).replace("'", "'\\''")
+                f.write(f"file '{escaped}'\n")
+        proc = subprocess.run(
+            ["ffmpeg", "-y", "-loglevel", "error", "-f", "concat", "-safe", "0",
+             "-i", list_path, *codec_args, out_path],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        if proc.returncode != 0:
+            raise RuntimeError(f"ffmpeg failed to merge audio: {proc.stderr.strip()}")
+    finally:
+        try:
+            os.remove(list_path)
+        except Exception:
+            pass
+    return out_path
+
+
+# Concurrent gTTS requests, the pause between submitting them, and how many
+# chunks may be queued for the pool at once.
+GTTS_WORKERS = 4
+GTTS_REQUEST_INTERVAL = 0.5
+GTTS_MAX_PENDING = GTTS_WORKERS * 2
+
+
+def _iter_chunks(text, n):
+    for i in range(0, len(text), n):
+        yield text[i:i+n]
+
+
+def _finish_gtts_chunks(futures, done, on_progress):
+    """Re-raise any chunk errors and report progress; return how many finished."""
+    count = 0
+    for fut in futures:
+        fut.result()
+        count += 1
+        if on_progress:
+            on_progress(f"Saved chunk {done + count}")
+    return count
+
+
+def _save_gtts_chunk(chunk, path, key):
+    _lazy("gtts").gTTS(chunk).save(path)
+    _cache_store(key, ".mp3", path)
+
+
 def save_with_gtts(text, out_path, on_progress=None):
-    if gTTS is None:
+    """Synthesize text with gTTS and save it as a single MP3.
+
+    text may be a string or an iterable of chunks (see iter_text_chunks);
+    chunks are synthesized as they arrive.
+    """
+    if _lazy("gtts") is None:
         raise RuntimeError("gTTS is not installed")
-    # gTTS can choke on very large strings; split into chunks if needed
-    max_chars = 4500
-    chunks = [text[i:i+max_chars] for i in range(0, len(text), max_chars)]
-    tmp_files = []
+    if isinstance(text, str):
+        # gTTS can choke on very large strings; split into chunks if needed
+        chunks = _iter_chunks(text, 4500)
+    else:
+        chunks = text
+    # gTTS is network-bound, so chunks are requested from a small thread pool;
+    # files are keyed by chunk index so the merge keeps document order.
+    files = {}
     try:
-        for idx, chunk in enumerate(chunks, start=1):
-            t = gTTS(chunk)
-            if len(chunks) == 1:
-                t.save(out_path)
-                if on_progress:
-                    on_progress(f"Saved: {out_path}")
-            else:
+        with ThreadPoolExecutor(max_workers=GTTS_WORKERS) as ex:
+            pending = set()
+            done = 0
+            submitted = 0
+            seen = {}  # cache key -> file already holding that chunk
+            for idx, chunk in enumerate(chunks, start=1):
+                key = _cache_key(chunk, "gtts")
+                if key in seen:
+                    files[idx] = seen[key]
+                    continue
                 tmp = tempfile.NamedTemporaryFile(delete=False, suffix=f"-{idx}.mp3")
                 tmp.close()
-                t.save(tmp.name)
-                tmp_files.append(tmp.name)
-                if on_progress:
-                    on_progress(f"Saved chunk {idx}/{len(chunks)} -> {tmp.name}")
-
-        if len(tmp_files) > 1:
-            if AudioSegment is None:
-                raise RuntimeError("pydub is required to merge MP3 chunks (and ffmpeg must be installed)")
-            # merge into out_path
-            out_full = AudioSegment.from_mp3(tmp_files[0])
-            for extra in tmp_files[1:]:
-                out_full += AudioSegment.from_mp3(extra)
+                files[idx] = seen[key] = tmp.name
+                if _cache_fetch(key, ".mp3", tmp.name):
+                    continue
+                if len(pending) >= GTTS_MAX_PENDING:
+                    # don't pull more chunks from the iterator than the pool
+                    # can work on, so only a few are held in memory at once
+                    finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    done += _finish_gtts_chunks(finished, done, on_progress)
+                pending.add(ex.submit(_save_gtts_chunk, chunk, tmp.name, key))
+                submitted += 1
+                # space out submissions so Google doesn't answer with 429s
+                time.sleep(GTTS_REQUEST_INTERVAL)
+            _finish_gtts_chunks(as_completed(pending), done, on_progress)
+        if submitted:
+            _cache_prune()
+        tmp_files = [files[idx] for idx in sorted(files)]
+
+        if len(tmp_files) == 1:
+            shutil.move(tmp_files[0], out_path)
+            if on_progress:
+                on_progress(f"Saved: {out_path}")
+        elif tmp_files and shutil.which("ffmpeg"):
+            concat_with_ffmpeg(tmp_files, out_path)
+            if on_progress:
+                on_progress(f"Merged chunks into {out_path}")
+        elif tmp_files:
+            pydub = _lazy("pydub")
+            if pydub is None:
+                raise RuntimeError("ffmpeg (or pydub) is required to merge MP3 chunks")
+            AudioSegment = pydub.AudioSegment
+            # merge into out_path; repeated `+=` copies the whole segment each
+            # time, so join the raw samples once and wrap them at the end
+            first = AudioSegment.from_mp3(tmp_files[0])
+            raw = b"".join(itertools.chain(
+                [first.raw_data],
+                (AudioSegment.from_mp3(extra).raw_data for extra in tmp_files[1:])))
+            out_full = first._spawn(raw)
             out_full.export(out_path, format="mp3")
             if on_progress:
                 on_progress(f"Merged chunks into {out_path}")
 
         return out_path
     finally:
-        for t in tmp_files:
+        for t in set(files.values()):
             try:
                 os.remove(t)
             except Exception:
                 pass
 
 
+EDGE_TTS_VOICE = "en-US-AriaNeural"
+# Chunks synthesized concurrently by edge-tts.
+EDGE_TTS_CONCURRENCY = 4
+
+
+async def _edge_tts_chunk(chunk, voice):
+    data = bytearray()
+    async for message in _lazy("edge_tts").Communicate(chunk, voice).stream():
+        if message["type"] == "audio":
+            data += message["data"]
+    return bytes(data)
+
+
+def save_with_edge_tts(text, out_path, voice=EDGE_TTS_VOICE, on_progress=None):
+    """Synthesize text with edge-tts and save it as a single MP3.
+
+    edge-tts streams MP3 frames over a WebSocket, so several chunks are
+    requested at once and their audio is appended to out_path in order; no
+    merge step is needed. text may be a string or an iterable of chunks (see
+    iter_text_chunks).
+    """
+    if _lazy("edge_tts") is None:
+        raise RuntimeError("edge-tts is not installed")
+    # asyncio is only needed here and is slow to import, so keep it off the
+    # startup path like the other backend-only dependencies
+    import asyncio
+    chunks = iter([text] if isinstance(text, str) else text)
+
+    async def _run():
+        loop = asyncio.get_running_loop()
+        pending = collections.deque()
+        done = 0
+        with open(out_path, "wb") as f:
+            while True:
+                # chunks may come from the PDF parser, so pull them off-loop
+                chunk = await loop.run_in_executor(None, next, chunks, None)
+                if chunk is not None:
+                    pending.append(asyncio.ensure_future(_edge_tts_chunk(chunk, voice)))
+                if pending and (chunk is None or len(pending) >= EDGE_TTS_CONCURRENCY):
+                    f.write(await pending.popleft())
+                    done += 1
+                    if on_progress:
+                        on_progress(f"Saved chunk {done}")
+                elif chunk is None:
+                    break
+
+    asyncio.run(_run())
+    if on_progress:
+        on_progress(f"Saved: {out_path}")
+    return out_path
+
+
 class App(tk.Tk):
     def __init__(self):
         super().__init__()
         self.title("PDF → Audiobook")
-        self.geometry("640x260")
+        self.geometry("640x315")
 
         self.pdf_path = tk.StringVar()
         self.output_path = tk.StringVar(value="audiobook")
@@ -143,6 +810,7 @@ class App(tk.Tk):
         self.voice_id = tk.StringVar(value="")
         self.rate = tk.IntVar(value=180)
         self.volume = tk.DoubleVar(value=1.0)
+        self.out_format = tk.StringVar(value="default")
 
         tk.Label(self, text="PDF file:").pack(anchor="w", padx=8, pady=(8, 0))
         frm = tk.Frame(self)
@@ -164,13 +832,22 @@ class App(tk.Tk):
         tk.Label(vfrm, text="Volume:").grid(row=0, column=4, sticky="w", padx=(8, 0))
         tk.Spinbox(vfrm, from_=0.1, to=1.0, increment=0.1, textvariable=self.volume, width=6).grid(row=0, column=5, sticky="w")
 
-        # populate voices if available
-        self.populate_voices()
+        # populate voices once the window is up; starting the speech driver
+        # is slow and would otherwise delay the first paint
+        self.after(50, self.populate_voices)
 
         modes = tk.Frame(self)
         modes.pack(fill="x", padx=8, pady=8)
         tk.Radiobutton(modes, text="Offline (pyttsx3 → WAV)", variable=self.mode, value="pyttsx3").pack(anchor="w")
         tk.Radiobutton(modes, text="Online (gTTS → MP3)", variable=self.mode, value="gtts").pack(anchor="w")
+        tk.Radiobutton(modes, text="Online (edge-tts → MP3)", variable=self.mode, value="edge_tts").pack(anchor="w")
+
+        ffrm = tk.Frame(self)
+        ffrm.pack(fill="x", padx=8)
+        tk.Label(ffrm, text="Output format:").pack(side="left")
+        # "default" keeps the backend's own WAV/MP3 output
+        ttk.Combobox(ffrm, textvariable=self.out_format, values=("default", "opus"),
+                     state="readonly", width=10).pack(side="left", padx=6)
 
         btn = tk.Button(self, text="Convert", command=self.convert)
         btn.pack(pady=6)
@@ -182,12 +859,11 @@ class App(tk.Tk):
         # Populate pyttsx3 voices into the OptionMenu (if pyttsx3 present)
         menu = self.voice_menu['menu']
         menu.delete(0, 'end')
-        if pyttsx3 is None:
+        if _lazy("pyttsx3") is None:
             menu.add_command(label="(pyttsx3 not installed)", command=lambda: self.voice_id.set(''))
             return
         try:
-            eng = pyttsx3.init()
-            voices = eng.getProperty('voices')
+            voices = get_voices()
             if not voices:
                 menu.add_command(label="(no voices found)", command=lambda: self.voice_id.set(''))
                 return
@@ -226,39 +902,81 @@ class App(tk.Tk):
         voice_choice = self.voice_id.get() or None
         rate_choice = self.rate.get()
         volume_choice = self.volume.get()
+        fmt_choice = self.out_format.get()
 
         def work():
+            native_ext = '.wav' if mode == "pyttsx3" else '.mp3'
+            tmp_out = None
             try:
+                if fmt_choice == "opus":
+                    if not shutil.which("ffmpeg"):
+                        raise RuntimeError("ffmpeg is required for Opus output")
+                    final = out_base if out_base.lower().endswith('.opus') else out_base + '.opus'
+                    # synthesize to a temporary file, then re-encode it
+                    fd, tmp_out = tempfile.mkstemp(suffix=native_ext)
+                    os.close(fd)
+                    out = tmp_out
+                else:
+                    out = final = out_base if out_base.lower().endswith(native_ext) else out_base + native_ext
+
+                # stream chunks straight from the parser into the TTS backend
                 self.set_status("Extracting text...")
-                text = extract_text_from_pdf(pdf)
-                if not text.strip():
+                if mode == "pyttsx3":
+                    chunks = iter_text_chunks(pdf, PYTTSX3_CHUNK_CHARS)
+                else:
+                    chunks = iter_text_chunks(pdf)
+                first = next(chunks, None)
+                if first is None:
                     messagebox.showerror("Error", "No text could be extracted from the PDF")
                     self.set_status("No text extracted")
                     return
-
+                chunks = itertools.chain([first], chunks)
                 if mode == "pyttsx3":
-                    out = out_base if out_base.lower().endswith('.wav') else out_base + '.wav'
                     self.set_status("Converting with pyttsx3 (offline)...")
-                    save_with_pyttsx3(text, out, rate=rate_choice, volume=volume_choice, voice_id=voice_choice, on_progress=self.set_status)
-                    messagebox.showinfo("Done", f"Saved audio: {out}")
-                    self.set_status("Done")
+                    save_with_pyttsx3(chunks, out, rate=rate_choice, volume=volume_choice, voice_id=voice_choice, on_progress=self.set_status)
+                elif mode == "edge_tts":
+                    self.set_status("Converting with edge-tts (online)...")
+                    save_with_edge_tts(chunks, out, on_progress=self.set_status)
                 else:
-                    out = out_base if out_base.lower().endswith('.mp3') else out_base + '.mp3'
                     self.set_status("Converting with gTTS (online)...")
-                    save_with_gtts(text, out, on_progress=self.set_status)
-                    messagebox.showinfo("Done", f"Saved audio: {out}")
-                    self.set_status("Done")
+                    save_with_gtts(chunks, out, on_progress=self.set_status)
+
+                if tmp_out is not None:
+                    self.set_status("Encoding Opus...")
+                    encode_opus(tmp_out, final)
+                messagebox.showinfo("Done", f"Saved audio: {final}")
+                self.set_status("Done")
             except Exception as e:
                 messagebox.showerror("Error", str(e))
                 self.set_status(f"Error: {e}")
+            finally:
+                if tmp_out is not None:
+                    try:
+                        os.remove(tmp_out)
+                    except Exception:
+                        pass
 
         threading.Thread(target=work, daemon=True).start()
 
 
 def main():
+    if not any(_installed(name) for name in PDF_BACKENDS):
+        # Show a friendly GUI error explaining how to install dependencies
+        try:
+            root = tk.Tk()
+            root.withdraw()
+            messagebox.showerror(
+                "Missing dependency",
+                "No PDF library is installed (PyMuPDF, pypdfium2 or PyPDF2).\n\nPlease run the following in PowerShell in this project folder:\n\npython -m venv .venv; .\\.venv\\Scripts\\Activate.ps1; python -m pip install --upgrade pip; pip install -r requirements.txt\n\nThen re-run this program.")
+        except Exception:
+            # fallback to printing
+            print("ERROR: no PDF library is installed. Run: pip install -r requirements.txt")
+        sys.exit(1)
     app = App()
     app.mainloop()
 
 
 if __name__ == "__main__":
+    # needed for the extraction process pool in frozen Windows builds
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file